@@ -25,10 +25,13 @@ class AIBrochureConfig:
         """
         return self.__get_config_value(key)
 
-    def _get_int(self, key: str) -> int:
+    def _get_int(self, key: str, default: int | None = None) -> int:
         """
         Get an integer value from the environment variables.
+        If a default is provided, it is returned when the variable is not set.
         """
+        if default is not None and not os.getenv(key):
+            return default
         value = self.__get_config_value(key)
         try:
             return int(value)
@@ -53,7 +56,29 @@ class AIBrochureConfig:
             self.__model_name = self._get_str("MODEL_NAME")
         return self.__model_name
 
+    @property
+    def max_main_page_chars(self) -> int:
+        """
+        Get the character budget for the main page text sent to the model.
+        Defaults to 6000 when MAX_MAIN_PAGE_CHARS is not set.
+        """
+        if self.__max_main_page_chars == 0:
+            self.__max_main_page_chars = self._get_int("MAX_MAIN_PAGE_CHARS", 6000)
+        return self.__max_main_page_chars
+
+    @property
+    def max_page_chars(self) -> int:
+        """
+        Get the character budget for each relevant sub-page text sent to the model.
+        Defaults to 3000 when MAX_PAGE_CHARS is not set.
+        """
+        if self.__max_page_chars == 0:
+            self.__max_page_chars = self._get_int("MAX_PAGE_CHARS", 3000)
+        return self.__max_page_chars
+
     def __init__(self) -> None:
         load_dotenv(dotenv_path=".env")
         self.__openai_api_key: str = ""
         self.__model_name: str = ""
+        self.__max_main_page_chars: int = 0
+        self.__max_page_chars: int = 0
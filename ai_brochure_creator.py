@@ -0,0 +1,448 @@
+from ai_core import AICore, ReasoningEffort, _get_client
+from ai_brochure_config import AIBrochureConfig
+from extractor_of_relevant_links import ExtractorOfRelevantLinks
+from website import Website
+from openai.types.responses import Response
+from rich.console import Console
+from rich.markdown import Markdown
+from rich.live import Live
+from collections.abc import Callable
+from json import dumps, loads
+from time import sleep
+from typing import Any, Final, NamedTuple
+import openai
+
+# Kept constant across instances so every request starts with an identical system prefix.
+_SYSTEM_BEHAVIOR: Final[str] = ("You are an assistant that analyzes the contents of several relevant pages from a company website "
+                                "and creates a short brochure about the company for prospective customers, investors and recruits. "
+                                "Include details of company culture, customers and careers/jobs if information is available. ")
+
+class RelevantPage(NamedTuple):
+    """A fetched page selected for the brochure, with the kind of page it is (e.g. 'about page')."""
+    type: str
+    page: Website
+
+class BrochureCreator(AICore[str]):
+    """
+    Builds a short Markdown brochure for a company or individual by:
+    - extracting relevant links from the website,
+    - inferring the entity name and status,
+    - and prompting the model using the collected page content.
+    """
+
+    @property
+    def _website(self) -> Website:
+        """Return the main Website instance to analyze."""
+        return self.__website
+
+    @property
+    def _extractor(self) -> ExtractorOfRelevantLinks:
+        """Return the helper responsible for extracting relevant links."""
+        return self.__extractor
+
+    def __init__(self, config: AIBrochureConfig, website: Website) -> None:
+        """
+        Initialize the brochure creator with configuration and target website.
+
+        Parameters:
+            config: AI and runtime configuration.
+            website: The root website to analyze and summarize.
+        """
+        super().__init__(config, _SYSTEM_BEHAVIOR)
+        self.__website: Website = website
+        self.__extractor: ExtractorOfRelevantLinks = ExtractorOfRelevantLinks(config, website)
+
+    def create_brochure(self, on_delta: Callable[[str], None] | None = None) -> str:
+        """
+        Create a short Markdown brochure based on the website's content.
+
+        Parameters:
+            on_delta: Optional callback receiving the brochure text incrementally while it is generated.
+
+        Returns:
+            A Markdown string with the brochure, or a fallback message if the main page could not be
+            fetched or no relevant pages were found.
+        """
+        brochure_prompt_part, content_found = self.collect_website_content()
+        if not content_found:
+            return brochure_prompt_part
+
+        # Send the scraped content once as its own message; the follow-up questions refer to it
+        # through the history, so every call shares the same prefix instead of repeating the text.
+        self.history_manager.add_user_message(brochure_prompt_part)
+        inferred_company_name, inferred_status = self._infer_entity()
+
+        full_brochure_prompt: str = self._form_full_prompt(inferred_company_name, inferred_status)
+        response: str = self.ask(full_brochure_prompt, on_delta=on_delta)
+        return response
+
+    def collect_website_content(self) -> tuple[str, bool]:
+        """
+        Collect the relevant pages of the website and form the prompt part with their excerpts.
+
+        Returns:
+            (text, found): the brochure prompt part and True, or a fallback message and False
+            if the main page could not be fetched or no relevant pages were found.
+        """
+        if self._website.fetch_failed:
+            # Without the main page there is nothing to extract links from; skip all model calls.
+            return f"Could not fetch {self._website.website_url}: {self._website.text}", False
+
+        relevant_pages: list[RelevantPage] = self._get_relevant_pages()
+        if not relevant_pages:
+            return "No relevant pages found to create a brochure.", False
+
+        return self._form_brochure_prompt(relevant_pages), True
+
+    def _get_relevant_pages(self) -> list[RelevantPage]:
+        """
+        Resolve relevant links into Website objects, fetched concurrently by Website.fetch_many.
+        """
+        relevant_links: list[dict[str, str]] = self._extractor.extract_relevant_links()["links"]
+        # Limit the number of pages to fetch to keep latency and token usage reasonable.
+        MAX_PAGES: int = 6
+        # Bound concurrency so a single site is not hammered with simultaneous requests.
+        MAX_FETCH_WORKERS: int = 5
+        # Skip links back to the main page and repeated links (e.g. the same page in the menu and the footer).
+        seen_urls: set[str] = {Website.normalize_url(self._website.website_url)}
+        unique_links: list[dict[str, str]] = []
+        for link in relevant_links:
+            normalized_url: str = Website.normalize_url(str(link.get("url", "")))
+            if normalized_url not in seen_urls:
+                seen_urls.add(normalized_url)
+                unique_links.append(link)
+        links_subset = unique_links[:MAX_PAGES]
+
+        websites: list[Website | None] = Website.fetch_many(
+            [str(link.get("url", "")) for link in links_subset],
+            max_workers=MAX_FETCH_WORKERS
+        )
+        return [
+            RelevantPage(str(link.get("type", "")), website)
+            for link, website in zip(links_subset, websites)
+            if website is not None
+        ]
+
+    def _truncate_text(self, text: str, limit: int) -> str:
+        """
+        Truncate text to 'limit' characters to reduce tokens and latency.
+        The middle of the text is collapsed, keeping the beginning and the end of the page,
+        where headings and contact/footer details usually are.
+        """
+        if len(text) <= limit:
+            return text
+        MARKER: str = " ... [truncated] ... "
+        budget: int = max(0, limit - len(MARKER))
+        head: int = budget * 2 // 3
+        tail: int = budget - head
+        return text[:head] + MARKER + (text[-tail:] if tail else "")
+
+    def _shingles(self, text: str, size: int = 8) -> set[int]:
+        """
+        Return hashes of the word n-grams of the text, used to detect near-duplicate pages.
+        """
+        words: list[str] = text.split()
+        return {hash(tuple(words[i:i + size])) for i in range(max(1, len(words) - size + 1))}
+
+    def _is_near_duplicate(self, shingles: set[int], seen: list[set[int]], threshold: float) -> bool:
+        """
+        Check whether the shingle set overlaps any already included page above the Jaccard threshold.
+        """
+        for other in seen:
+            union: int = len(shingles | other)
+            if union and len(shingles & other) / union > threshold:
+                return True
+        return False
+
+    def _form_brochure_prompt(self, relevant_pages: list[RelevantPage]) -> str:
+        """
+        Assemble a prompt that includes the main page and relevant pages' titles and text.
+
+        Parameters:
+            relevant_pages: List of page descriptors returned by _get_relevant_pages.
+
+        Returns:
+            A prompt string containing quoted sections per page.
+        """
+        QUOTE_DELIMITER: str = "\n\"\"\"\n"
+        # Pages sharing most of their text (e.g. the same template with little content) add tokens, not information.
+        NEAR_DUPLICATE_THRESHOLD: float = 0.8
+        main_page: Website = self._website
+        main_text: str = self._truncate_text(main_page.text, self.config.max_main_page_chars)
+        seen_shingles: list[set[int]] = [self._shingles(main_text)]
+        # Collect the sections and join once; repeated += on large page texts copies the whole prompt each time.
+        parts: list[str] = [
+            f"Main page:{QUOTE_DELIMITER}"
+            f"Title: {main_page.title}\n"
+            f"Text:\n{main_text}{QUOTE_DELIMITER}\n"
+        ]
+
+        for relevant_page in relevant_pages:
+            if not relevant_page.page.fetch_failed:
+                text: str = self._truncate_text(relevant_page.page.text, self.config.max_page_chars)
+                shingles: set[int] = self._shingles(text)
+                if self._is_near_duplicate(shingles, seen_shingles, NEAR_DUPLICATE_THRESHOLD):
+                    continue
+                seen_shingles.append(shingles)
+                parts.append(
+                    f"{relevant_page.type}:{QUOTE_DELIMITER}"
+                    f"Title: {relevant_page.page.title}\n"
+                    f"Text:\n{text}{QUOTE_DELIMITER}\n"
+                )
+
+        return "".join(parts)
+
+    def _infer_entity(self) -> tuple[str, str]:
+        """
+        Infer both the entity name and status in a single model call to reduce latency.
+        The website excerpts are expected to be already stored in the chat history.
+        Returns:
+            (name, status) where status is 'company' or 'individual'.
+        """
+        prompt = (
+            "From the website excerpts above, infer the entity name and whether it is a company or an individual. "
+            "Respond strictly as JSON with keys 'name' and 'status' (status must be 'company' or 'individual')."
+        )
+        # The reply is a tiny JSON object; the cap (which also covers reasoning tokens) prevents runaway decoding.
+        MAX_OUTPUT_TOKENS: int = 1024
+        # A short classification does not need deliberate reasoning; "low" is the lowest level
+        # every reasoning model accepts, whichever MODEL_NAME is configured.
+        raw = self.ask(prompt, effort="low", max_output_tokens=MAX_OUTPUT_TOKENS).strip()
+        # Models occasionally wrap the JSON in a Markdown code fence despite the instructions;
+        # unwrap it instead of falling back, since the fallback loses the status entirely.
+        if raw.startswith("```"):
+            raw = raw.strip("`").removeprefix("json").strip()
+        try:
+            data: dict[str, str] = loads(raw)
+            if not isinstance(data, dict):
+                raise ValueError("Expected a JSON object")
+            name: str = str(data.get("name", "")).strip() or "Unknown"
+            status: str = str(data.get("status", "")).strip().lower()
+            if status not in ("company", "individual"):
+                status = "company"
+            return name, status
+        except Exception:
+            # Fallback: use entire output as name, assume company
+            return raw.strip() or "Unknown", "company"
+
+    def _form_full_prompt(self, inferred_company_name: str, inferred_status: str) -> str:
+        """
+        Build the final brochure-generation prompt using the inferred entity and prior history.
+
+        Parameters:
+            inferred_company_name: The inferred entity name.
+            inferred_status: Either 'company' or 'individual'.
+
+        Returns:
+            A final prompt instructing the model to produce a Markdown brochure.
+        """
+        full_prompt: str = (f"You are looking at a {inferred_status} called {inferred_company_name}, to whom website {self._website.website_url} belongs.\n"
+                            f"Build a short brochure about the {inferred_status}. Use the information from the website that is already stored in the history.\n"
+                            "Your response must be in a Markdown format.")
+        return full_prompt
+
+    def ask(self, question: str, effort: ReasoningEffort = "low", on_delta: Callable[[str], None] | None = None, max_output_tokens: int | None = None) -> str:
+        """
+        Send a question to the model, update chat history, and return the text output.
+
+        Parameters:
+            question: The user prompt.
+            effort: The reasoning effort the model should spend on the question.
+            on_delta: Optional callback receiving output text chunks; enables streaming.
+            max_output_tokens: Optional upper bound for generated tokens, including reasoning tokens.
+
+        Returns:
+            The model output text.
+        """
+        response: Response = self._create_response(
+            question,
+            on_delta,
+            effort,
+            max_output_tokens=max_output_tokens if max_output_tokens is not None else openai.NOT_GIVEN
+        )
+        return response.output_text
+
+class BatchBrochureCreator:
+    """
+    Builds brochures for many websites at once through the OpenAI Batch API.
+
+    Relevant pages are still collected per website, but the brochure requests are
+    submitted together as a single batch job, which is billed at a discount and
+    processed asynchronously by the server. Because batched requests cannot depend
+    on each other, the entity name and status are inferred within the brochure request.
+    """
+
+    __PENDING_STATUSES: tuple[str, ...] = ("validating", "in_progress", "finalizing", "cancelling")
+
+    @property
+    def config(self) -> AIBrochureConfig:
+        """Return the AI and runtime configuration."""
+        return self.__config
+
+    @property
+    def _ai_api(self) -> openai.OpenAI:
+        """Return the shared OpenAI API client for the configured API key."""
+        return _get_client(self.config.openai_api_key)
+
+    def __init__(self, config: AIBrochureConfig, websites: list[Website], poll_interval: float = 30.0) -> None:
+        """
+        Initialize the batch creator with configuration and target websites.
+
+        Parameters:
+            config: AI and runtime configuration.
+            websites: The root websites to analyze and summarize.
+            poll_interval: Seconds to wait between batch status checks.
+        """
+        self.__config: AIBrochureConfig = config
+        self.__websites: list[Website] = websites
+        self.__creators: list[BrochureCreator] = [BrochureCreator(config, website) for website in websites]
+        self.__poll_interval: float = poll_interval
+
+    def create_brochures(self) -> list[str]:
+        """
+        Create a short Markdown brochure for every website.
+
+        Returns:
+            Brochures in the same order as the websites; a fallback message is used for websites
+            that could not be fetched, have no relevant pages or whose batch request failed.
+        """
+        brochures: list[str] = [""] * len(self.__creators)
+        request_lines: list[str] = []
+        for index, (website, creator) in enumerate(zip(self.__websites, self.__creators)):
+            # The same content and fallback messages as BrochureCreator.create_brochure.
+            brochure_prompt_part, content_found = creator.collect_website_content()
+            if content_found:
+                request_lines.append(dumps(self._form_batch_request(str(index), website, brochure_prompt_part)))
+            else:
+                brochures[index] = brochure_prompt_part
+
+        if not request_lines:
+            return brochures
+
+        for custom_id, brochure in self._run_batch(request_lines).items():
+            brochures[int(custom_id)] = brochure
+        return brochures
+
+    def _form_batch_request(self, custom_id: str, website: Website, brochure_prompt_part: str) -> dict[str, Any]:
+        """
+        Build one line of the batch input file for the given website.
+
+        Parameters:
+            custom_id: Identifier used to match the result back to the website.
+            website: The root website the brochure is about.
+            brochure_prompt_part: Page excerpts returned by BrochureCreator.collect_website_content.
+
+        Returns:
+            A batch request object targeting the Responses endpoint.
+        """
+        prompt: str = (f"{brochure_prompt_part}\n"
+                       f"The website {website.website_url} belongs either to a company or to an individual. "
+                       "Infer which one it is and its name, then build a short brochure about them using the excerpts above.\n"
+                       "Your response must be in a Markdown format.")
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/responses",
+            "body": {
+                "model": self.config.model_name,
+                "instructions": _SYSTEM_BEHAVIOR,
+                "input": prompt,
+                "reasoning": { "effort": "low" }
+            }
+        }
+
+    def _run_batch(self, request_lines: list[str]) -> dict[str, str]:
+        """
+        Upload the requests, wait for the batch to finish and collect its outputs.
+
+        Parameters:
+            request_lines: JSONL lines produced by _form_batch_request.
+
+        Returns:
+            A mapping of custom_id to brochure text (or an error message) for every submitted request.
+        """
+        input_file = self._ai_api.files.create(
+            file=("brochures.jsonl", "\n".join(request_lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self._ai_api.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/responses",
+            completion_window="24h"
+        )
+        while batch.status in self.__PENDING_STATUSES:
+            sleep(self.__poll_interval)
+            batch = self._ai_api.batches.retrieve(batch.id)
+
+        results: dict[str, str] = {
+            loads(line)["custom_id"]: f"Brochure could not be generated (batch {batch.status})."
+            for line in request_lines
+        }
+        if batch.output_file_id:
+            for line in self._ai_api.files.content(batch.output_file_id).text.splitlines():
+                if line.strip():
+                    result: dict[str, Any] = loads(line)
+                    brochure: str = self._output_text(result)
+                    if brochure:
+                        results[result["custom_id"]] = brochure
+        return results
+
+    def _output_text(self, result: dict[str, Any]) -> str:
+        """
+        Extract the text output from one line of the batch output file.
+
+        Parameters:
+            result: A parsed batch output line.
+
+        Returns:
+            The concatenated output text, or an empty string if the request failed.
+        """
+        response: dict[str, Any] = result.get("response") or {}
+        if response.get("status_code") != 200:
+            return ""
+        return "".join(
+            content.get("text", "")
+            for item in response.get("body", {}).get("output", [])
+            if item.get("type") == "message"
+            for content in item.get("content", [])
+            if content.get("type") == "output_text"
+        )
+
+console: Console = Console()
+
+def display_markdown(content: str) -> None:
+    """
+    Render Markdown content to the console using rich.
+    """
+    console.print(Markdown(content))
+
+def display_brochure_stream(brochure_creator: BrochureCreator) -> str:
+    """
+    Create a brochure and render it to the console while it is being generated.
+    """
+    streamed: list[str] = []
+    with Live(console=console, vertical_overflow="visible") as live:
+        def render_delta(delta: str) -> None:
+            streamed.append(delta)
+            live.update(Markdown("".join(streamed)))
+
+        brochure: str = brochure_creator.create_brochure(on_delta=render_delta)
+
+    if not streamed:
+        # Nothing was streamed (e.g. no relevant pages), so render the returned message instead.
+        display_markdown(brochure)
+    return brochure
+
+def show_summary(summary: str) -> None:
+    """
+    Print a Markdown summary if provided; otherwise print a fallback message.
+    """
+    if summary:
+        display_markdown(summary)
+    else:
+        console.print("No summary found.")
+
+if __name__ == "__main__":
+    website: Website = Website.get("<put your site address here>")
+    brochure_creator: BrochureCreator = BrochureCreator(AIBrochureConfig(), website)
+    brochure: str = display_brochure_stream(brochure_creator)
\ No newline at end of file
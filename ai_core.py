@@ -1,14 +1,37 @@
+import logging
 import openai
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from time import perf_counter
 from ai_brochure_config import AIBrochureConfig
+from collections.abc import Callable, Iterable
 from typing import Any, cast, Generic, TypeVar
-from openai.types.responses import ResponseInputItemParam, Response, ResponseOutputMessage
+from openai.types.shared import ReasoningEffort
+from openai.types.responses import (
+    ResponseInputItemParam, Response, ResponseOutputMessage, ResponseStreamEvent,
+    ResponseTextDeltaEvent, ResponseCompletedEvent, ResponseIncompleteEvent, ResponseFailedEvent
+)
 
 TAiResponse = TypeVar('TAiResponse', default=Any)
 
+_logger: logging.Logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=None)
+def _get_client(api_key: str) -> openai.OpenAI:
+    """
+    Return a process-wide OpenAI client for the given API key.
+
+    Sharing one client lets every AICore subclass reuse the same underlying
+    HTTP connection pool instead of opening its own connections.
+    """
+    return openai.OpenAI(api_key=api_key)
+
 class HistoryManager:
     """
     Manage chat history and system behavior for a conversation with the model.
+
+    The system behavior is kept out of the chat history and sent separately as
+    instructions, so the history is a plain append-only list of conversation items.
     """
     @property
     def chat_history(self) -> list[ResponseInputItemParam]:
@@ -107,32 +130,24 @@ class AICore(ABC, Generic[TAiResponse]):
     @property
     def _ai_api(self) -> openai.OpenAI:
         """
-        Return the cached OpenAI API client, initializing it on first access.
+        Return the shared OpenAI API client for the configured API key.
 
-        This private helper lazily constructs and caches an openai.OpenAI client using
-        the API key found on self.config.openai_api_key. On the first call, if the
-        client has not yet been created, the method verifies that self.config is set,
-        creates the client with openai.OpenAI(api_key=...), stores it on
-        self.__ai_api, and returns it. Subsequent calls return the same cached
-        instance.
+        The client is obtained from the module-level _get_client cache, keyed by
+        self.config.openai_api_key, so all AICore instances using the same key
+        share a single client and its connection pool.
 
         Returns:
             openai.OpenAI: A configured OpenAI API client.
 
         Raises:
-            ValueError: If self.config is None when attempting to initialize the client.
+            ValueError: If self.config is None when attempting to obtain the client.
 
         Notes:
-            - The method mutates self.__ai_api as a side effect (caching).
             - The caller should treat this as a private implementation detail.
-            - Thread safety is not guaranteed; concurrent initialization may result in
-              multiple client instances if invoked from multiple threads simultaneously.
         """
-        if self.__ai_api is None:
-            if self.config is None:
-                raise ValueError("Configuration must be set before accessing AI API")
-            self.__ai_api = openai.OpenAI(api_key=self.config.openai_api_key)
-        return self.__ai_api
+        if self.config is None:
+            raise ValueError("Configuration must be set before accessing AI API")
+        return _get_client(self.config.openai_api_key)
 
     @property
     def history_manager(self) -> HistoryManager:
@@ -159,21 +174,114 @@ class AICore(ABC, Generic[TAiResponse]):
         # Initialize all instance-level attributes here
         self.__config: AIBrochureConfig = config
         self.__history_manager: HistoryManager = HistoryManager(system_behavior)
-        self.__ai_api: openai.OpenAI | None = None
+        # Server-side conversation state: the id of the last stored response and how many
+        # history items it already covers, so only new items have to be sent next time.
+        self.__last_response_id: str | None = None
+        self.__sent_items: int = 0
 
         if __debug__:
             # Sanity check: confirm attributes are initialized
             assert hasattr(self, "_AICore__config")
             assert hasattr(self, "_AICore__history_manager")
-            assert hasattr(self, "_AICore__ai_api")
+            assert hasattr(self, "_AICore__last_response_id")
+            assert hasattr(self, "_AICore__sent_items")
+
+    def _create_response(self, question: str, on_delta: Callable[[str], None] | None = None, effort: ReasoningEffort = "low", **options: Any) -> Response:
+        """
+        Send a question to the model as a continuation of the stored conversation.
+
+        Only the history items added since the previous response are sent as input;
+        earlier turns are referenced through previous_response_id, so the payload stays
+        small and the server can reuse its cached conversation prefix.
+
+        Parameters:
+            question: The user prompt.
+            on_delta: Optional callback receiving output text chunks as they are generated.
+                When given, the response is streamed instead of awaited as a whole.
+            effort: Reasoning effort; use the lowest level that suits the task,
+                since reasoning tokens are billed and add latency.
+            **options: Extra keyword arguments forwarded to responses.create.
+
+        Returns:
+            Response: The model response, already recorded in the chat history.
+        """
+        self.history_manager.add_user_message(question)
+        request: dict[str, Any] = {
+            "model": self.config.model_name,
+            "instructions": self.history_manager.system_behavior,
+            "input": self.history_manager.chat_history[self.__sent_items:],
+            "previous_response_id": self.__last_response_id or openai.NOT_GIVEN,
+            "store": True,
+            "reasoning": {"effort": effort},
+            **options
+        }
+        started: float = perf_counter()
+        response: Response
+        if on_delta is None:
+            response = self._ai_api.responses.create(**request)
+        else:
+            response = self.__read_stream(self._ai_api.responses.create(stream=True, **request), on_delta)
+        self.__log_usage(response, effort, perf_counter() - started)
+        self.history_manager.add_assistant_message(response)
+        self.__last_response_id = response.id
+        self.__sent_items = len(self.history_manager.chat_history)
+        return response
+
+    def __log_usage(self, response: Response, effort: ReasoningEffort, elapsed: float) -> None:
+        """
+        Log token usage and duration of a model call at debug level, to help tune reasoning effort.
+
+        Parameters:
+            response: The completed model response.
+            effort: The reasoning effort the call was made with.
+            elapsed: Wall-clock duration of the call in seconds.
+        """
+        usage = response.usage
+        if usage is None:
+            return
+        _logger.debug(
+            "%s: effort=%s, input=%d (cached %d), output=%d (reasoning %d) tokens, %.2fs",
+            type(self).__name__,
+            effort,
+            usage.input_tokens,
+            usage.input_tokens_details.cached_tokens,
+            usage.output_tokens,
+            usage.output_tokens_details.reasoning_tokens,
+            elapsed
+        )
+
+    def __read_stream(self, stream: Iterable[ResponseStreamEvent], on_delta: Callable[[str], None]) -> Response:
+        """
+        Forward streamed output text to the callback and return the final response.
+
+        Parameters:
+            stream: The server-sent events of a streamed response.
+            on_delta: Callback receiving each output text chunk.
+
+        Returns:
+            Response: The final response carried by the terminal stream event.
+
+        Raises:
+            RuntimeError: If the stream ends without a final response.
+        """
+        response: Response | None = None
+        for event in stream:
+            if isinstance(event, ResponseTextDeltaEvent):
+                on_delta(event.delta)
+            elif isinstance(event, (ResponseCompletedEvent, ResponseIncompleteEvent, ResponseFailedEvent)):
+                response = event.response
+        if response is None:
+            raise RuntimeError("The response stream ended without a final response")
+        return response
 
     @abstractmethod
-    def ask(self, question: str) -> TAiResponse:
+    def ask(self, question: str, effort: ReasoningEffort = "low") -> TAiResponse:
         """
         Ask a question to the AI model.
 
         Parameters:
             question: The question to ask.
+            effort: The reasoning effort the model should spend on the question.
 
         Returns:
             TAiResponse: The model's response type defined by the subclass.
@@ -1,11 +1,43 @@
 from ai_brochure_config import AIBrochureConfig
 from website import Website
-from ai_core import AICore
+from ai_core import AICore, ReasoningEffort
 from openai.types.responses import Response
 from json import loads
+from typing import Any, Final
 
 RelevantLinksDict = dict[str, list[dict[str, str]]]
 
+_SYSTEM_BEHAVIOR: Final[str] = ("You are an expert in creation of online advertisement materials."
+                                "You are going to be provided with a list of links found on a website."
+                                "You are able to decide which of the links would be most relevant to include in a brochure about the company,"
+                                "such as links to an About page or a Company page or Careers/Jobs pages.")
+
+# Structured output format for the extractor; the model is constrained to return exactly this shape.
+_RELEVANT_LINKS_FORMAT: dict[str, Any] = {
+    "type": "json_schema",
+    "name": "relevant_links",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "links": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "type": {"type": "string", "description": "Kind of page, e.g. 'about page' or 'careers page'."},
+                        "url": {"type": "string", "description": "Full HTTPS URL of the page."}
+                    },
+                    "required": ["type", "url"],
+                    "additionalProperties": False
+                }
+            }
+        },
+        "required": ["links"],
+        "additionalProperties": False
+    }
+}
+
 class ExtractorOfRelevantLinks(AICore[RelevantLinksDict]):
     """
     Extractor for relevant links from a website.
@@ -24,21 +56,7 @@ class ExtractorOfRelevantLinks(AICore[RelevantLinksDict]):
             config: AI and runtime configuration.
             website: The Website from which links were collected.
         """
-        system_behavior: str = ("You are an expert in creation of online advertisement materials."
-                                  "You are going to be provided with a list of links found on a website."
-                                  "You are able to decide which of the links would be most relevant to include in a brochure about the company,"
-                                  "such as links to an About page or a Company page or Careers/Jobs pages.\n"
-                                  "You should respond in JSON as in this example:")
-        system_behavior += """
-        {
-            "links": [
-                {"type": "about page", "url": "https://www.example.com/about"},
-                {"type": "company page", "url": "https://www.another_example.net/company"},
-                {"type": "careers page", "url": "https://ex.one_more_example.org/careers"}
-            ]
-        }
-        """
-        super().__init__(config, system_behavior)
+        super().__init__(config, _SYSTEM_BEHAVIOR)
         self.__website: Website = website
 
     def get_links_user_prompt(self) -> str:
@@ -51,7 +69,7 @@ class ExtractorOfRelevantLinks(AICore[RelevantLinksDict]):
         starter_part: str = (f"Here is a list of links found on the website of {self.website.website_url} - "
                              "please decide which of these links are relevant web links for a brochure about company."
                              "Respond with full HTTPS URLs. Avoid including Terms of Service, Privacy, email links.\n"
-                             "Links (some might be relative links):\n")
+                             "Links:\n")
 
         links_part: str = "\n".join(f"- {link}" for link in self.website.links_on_page) if self.website.links_on_page else "No links found."
 
@@ -68,24 +86,21 @@ class ExtractorOfRelevantLinks(AICore[RelevantLinksDict]):
         response = self.ask(user_prompt)
         return response
 
-    def ask(self, question: str) -> RelevantLinksDict:
+    def ask(self, question: str, effort: ReasoningEffort = "low") -> RelevantLinksDict:
         """
         Send a question to the model and parse the JSON response.
+        The response is constrained to the relevant links schema, so it is always valid JSON.
 
         Parameters:
             question: The prompt to submit.
+            effort: The reasoning effort the model should spend on the selection.
 
         Returns:
             RelevantLinksDict: Parsed JSON containing selected links.
         """
-        self.history_manager.add_user_message(question)
-        
-        response: Response = self._ai_api.responses.create(
-            model=self.config.model_name,
-            instructions=self.history_manager.system_behavior,
-            reasoning={ "effort": "low" },
-            input=self.history_manager.chat_history
+        response: Response = self._create_response(
+            question,
+            effort=effort,
+            text={ "format": _RELEVANT_LINKS_FORMAT }
         )
-
-        self.history_manager.add_assistant_message(response)
         return loads(response.output_text)
\ No newline at end of file
@@ -0,0 +1,60 @@
+import unittest
+from website import Extractor
+
+NON_ASCII_PAGE: bytes = (b"<html><head>%s<title>Acme</title></head><body><p>Intro text</p>"
+                         b"<p>caf\xe9 \x81 here</p><p>More text</p><a href='/about'>About</a></body></html>")
+
+class ExtractorLinksTest(unittest.TestCase):
+    """
+    Tests for the links reported by Extractor.
+    """
+
+    def test_malformed_href_is_skipped(self) -> None:
+        html: bytes = b'<html><body><a href="http://[broken">Bad</a><a href="/about">About</a></body></html>'
+        extractor: Extractor = Extractor(html, "https://example.com/")
+        self.assertEqual(extractor.extracted_links_on_page, ["https://example.com/about"])
+
+    def test_base_href_is_honored(self) -> None:
+        html: bytes = b'<html><head><base href="/"></head><body><a href="about">About</a></body></html>'
+        extractor: Extractor = Extractor(html, "https://example.com/en/home")
+        self.assertEqual(extractor.extracted_links_on_page, ["https://example.com/about"])
+
+class ExtractorTitleTest(unittest.TestCase):
+    """
+    Tests for the title reported by Extractor.
+    """
+
+    def test_title_moved_out_of_head_is_found(self) -> None:
+        for head in (b"<img src='pixel.gif'>", b"stray"):
+            extractor: Extractor = Extractor(b"<html><head>%s<title>Acme</title></head><body>Text</body></html>" % head)
+            self.assertEqual(extractor.extracted_title, "Acme")
+
+    def test_svg_title_is_ignored(self) -> None:
+        extractor: Extractor = Extractor(b"<html><body><svg><title>Icon</title></svg>Text</body></html>")
+        self.assertEqual(extractor.extracted_title, "No title")
+
+class ExtractorEncodingTest(unittest.TestCase):
+    """
+    Tests for documents whose bytes do not match their declared encoding.
+    """
+
+    def test_ascii_header_charset_keeps_whole_page(self) -> None:
+        extractor: Extractor = Extractor(NON_ASCII_PAGE % b"", "https://example.com/", "us-ascii")
+        self.assertEqual(extractor.extracted_links_on_page, ["https://example.com/about"])
+        self.assertIn("caf\u00e9", extractor.extracted_text)
+        self.assertTrue(extractor.extracted_text.endswith("More text About"))
+
+    def test_ascii_meta_charset_keeps_whole_page(self) -> None:
+        extractor: Extractor = Extractor(NON_ASCII_PAGE % b"<meta charset='us-ascii'>", "https://example.com/")
+        self.assertEqual(extractor.extracted_links_on_page, ["https://example.com/about"])
+        self.assertIn("caf\u00e9", extractor.extracted_text)
+        self.assertTrue(extractor.extracted_text.endswith("More text About"))
+
+    def test_str_with_xml_declaration_is_parsed(self) -> None:
+        html: str = "<?xml version='1.0' encoding='utf-8'?><html><head><title>Acme</title></head><body>caf\u00e9</body></html>"
+        extractor: Extractor = Extractor(html, "https://example.com/")
+        self.assertEqual(extractor.extracted_title, "Acme")
+        self.assertEqual(extractor.extracted_text, "caf\u00e9")
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
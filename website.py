@@ -1,79 +1,353 @@
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from ipaddress import ip_address, IPv4Address, IPv6Address
-from urllib.parse import ParseResult, urlparse
-from bs4 import BeautifulSoup, Tag
-from requests import get, RequestException, Session
+from threading import Lock, local
+from time import monotonic
+from urllib.parse import ParseResult, urldefrag, urljoin, urlparse, urlunparse
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
+from requests import RequestException, Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+def _create_session() -> Session:
+    """
+    Create the HTTP session shared by all Website fetches.
+
+    The session keeps connections alive between requests to the same host,
+    retries transient connection failures with a short backoff and sends
+    browser-like default headers with every request. Compressed responses are
+    negotiated through the Accept-Encoding header that requests sets by default
+    (gzip and deflate, plus br when the brotli package is installed).
+    """
+    session: Session = Session()
+    session.headers.update({
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml"
+    })
+    adapter: HTTPAdapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+_SESSION: Session = _create_session()
+
+_LOCAL_HOSTNAMES: frozenset[str] = frozenset({"localhost", "127.0.0.1", "::1"})
+
+def _is_local_address(hostname: str) -> bool:
+    """
+    Check if the given hostname is a local address.
+
+    Parameters:
+        hostname (str): The hostname to check.
+
+    Returns:
+        bool: True if the hostname is a local address, False otherwise.
+    """
+    if hostname in _LOCAL_HOSTNAMES:
+        return True
+
+    # Only IP literals can be parsed by ip_address; skip raising and catching ValueError for DNS names.
+    if not (hostname[:1].isdigit() or ":" in hostname):
+        return False
+
+    try:
+        ip: IPv4Address | IPv6Address = ip_address(hostname)
+        if ip.is_loopback or ip.is_private or ip.is_link_local or ip.is_reserved:
+            return True
+    except ValueError:
+        return False
+
+    return False
+
+@lru_cache(maxsize=4096)
+def _validate_url(website_url: str, allowed_domains: tuple[str, ...]) -> ParseResult:
+    """
+    Parse and validate a website URL.
+
+    Validation is a pure function of its arguments, so results are memoized:
+    links seen again while crawling a site are not re-parsed and re-checked.
+
+    Parameters:
+        website_url (str): The URL to validate.
+        allowed_domains (tuple[str, ...]): The allowed hostname suffixes.
+
+    Returns:
+        ParseResult: The parsed URL.
+
+    Raises:
+        ValueError: If the URL is empty, missing parts, uses an invalid scheme,
+                    points to a local/private address, or is not in allowed domains.
+    """
+    if not website_url:
+        raise ValueError("Website URL must be provided")
+
+    parsed_url: ParseResult = urlparse(website_url)
+
+    if not parsed_url.netloc or parsed_url.scheme not in ("http", "https"):
+        raise ValueError("Website URL must be a valid URL")
+
+    if not parsed_url.hostname:
+        raise ValueError("Website URL must contain a valid hostname")
+
+    if _is_local_address(parsed_url.hostname):
+        raise ValueError("Website URL must not be a local address")
+
+    if not parsed_url.hostname.endswith(allowed_domains):
+        raise ValueError("Website URL must be an allowed domain")
+
+    return parsed_url
+
+_parser_state: local = local()
+
+# Labels the WHATWG Encoding Standard maps to windows-1252, as browsers do: pages declared as
+# ASCII or Latin-1 routinely contain other bytes, at which libxml2 would stop reading.
+_WINDOWS_1252_LABELS: frozenset[str] = frozenset({
+    "ansi_x3.4-1968", "ascii", "cp1252", "cp819", "csisolatin1", "ibm819", "iso-8859-1", "iso-ir-100",
+    "iso8859-1", "iso88591", "iso_8859-1", "iso_8859-1:1987", "l1", "latin1", "us-ascii", "x-cp1252"
+})
+
+def _web_encoding(encoding: str | None) -> str | None:
+    """
+    Map a declared encoding label to the encoding a browser would decode the document with.
+
+    Parameters:
+        encoding (str | None): The declared encoding label, if any.
+
+    Returns:
+        str | None: "windows-1252" for ASCII and Latin-1 labels, otherwise the label unchanged.
+    """
+    if encoding is not None and encoding.strip().lower() in _WINDOWS_1252_LABELS:
+        return "windows-1252"
+    return encoding
+
+def _stopped_at_invalid_bytes(parser: lxml.html.HTMLParser) -> bool:
+    """
+    Check whether the last parse ended early at bytes that are invalid in the document encoding.
+
+    libxml2 reports this as an input (IO) error and silently drops the rest of the document.
+    """
+    return any(
+        error.domain == etree.ErrorDomains.IO and error.type == etree.ErrorTypes.ERR_INVALID_ENCODING
+        for error in parser.error_log
+    )
+
+def _html_parser(encoding: str | None = None) -> lxml.html.HTMLParser:
+    """
+    Return the HTML parser of the current thread for the given encoding, creating it on first use.
+
+    The parser drops comments and processing instructions while parsing, so they never
+    become tree nodes. lxml parsers must not be shared between threads, hence one per thread.
+
+    Parameters:
+        encoding (str | None, optional): The document encoding. If None, libxml2 detects it
+            from the document itself (byte order mark or <meta charset>).
+
+    Raises:
+        LookupError: If the encoding is unknown.
+    """
+    parsers: dict[str | None, lxml.html.HTMLParser] | None = getattr(_parser_state, "parsers", None)
+    if parsers is None:
+        parsers = {}
+        _parser_state.parsers = parsers
+    parser: lxml.html.HTMLParser | None = parsers.get(encoding)
+    if parser is None:
+        parser = lxml.html.HTMLParser(encoding=encoding, remove_comments=True, remove_pis=True)
+        parsers[encoding] = parser
+    return parser
 
 class Extractor:
     """
-    Extracts and processes content from HTML response text using BeautifulSoup.
+    Extracts and processes content from HTML response text using lxml.
     """
-    __soup: BeautifulSoup
+    # Tags whose content is not readable page text; stripped from the tree in a single C-level pass.
+    __IRRELEVANT_TAGS: frozenset[str] = frozenset({
+        "script", "style", "noscript", "img", "figure", "video", "audio", "button",
+        "svg", "canvas", "iframe", "input", "form", "meta", "link"
+    })
+    # Body text only: the title is reported separately, and <head> holds no readable content.
+    __TEXT_NODES: etree.XPath = etree.XPath("//body//text()", smart_strings=False)
+    __WHITESPACE: re.Pattern[str] = re.compile(r"\s+")
+    __LINK_HREFS: etree.XPath = etree.XPath("//a/@href", smart_strings=False)
+    # libxml2 moves <title> into <body> when body-only content (e.g. a tracking <img>) precedes it in <head>.
+    __ANY_TITLE_TEXT: etree.XPath = etree.XPath("(//title[not(ancestor::svg)])[1]/text()", smart_strings=False)
+    __BASE_HREF: etree.XPath = etree.XPath("(//base/@href)[1]", smart_strings=False)
+    # Links that never point to another page worth reading.
+    __SKIPPED_LINK_PREFIXES: tuple[str, ...] = ("javascript:", "mailto:", "tel:", "#")
+
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access.
+    __slots__ = (
+        "__raw", "__encoding", "__base_url", "__tree",
+        "__extracted_title", "__extracted_text", "__extracted_links_on_page"
+    )
 
-    __extracted_title: str = ""
     @property
     def extracted_title(self) -> str:
         """
         Returns the extracted title from the HTML content.
         """
-        if not self.__extracted_title:
-            self.__extracted_title = self.get_title()
-        return self.__extracted_title
+        extracted_title: str | None = self.__extracted_title
+        if extracted_title is None:
+            extracted_title = self.__extracted_title = self.get_title()
+        return extracted_title
 
-    __extracted_text: str = ""
     @property
     def extracted_text(self) -> str:
         """
         Returns the extracted main text content from the HTML, excluding irrelevant tags.
         """
-        if not self.__extracted_text:
-            self.__extracted_text = self.get_text()
-        return self.__extracted_text
+        extracted_text: str | None = self.__extracted_text
+        if extracted_text is None:
+            extracted_text = self.__extracted_text = self.get_text()
+        return extracted_text
 
-    __extracted_links_on_page: list[str] | None = None
     @property
     def extracted_links_on_page(self) -> list[str]:
         """
-        Return all href values found on the page.
+        Return the distinct links found on the page as absolute URLs.
 
         Notes:
             - Only anchor tags with an href are included.
-            - Values are returned as-is (may be relative or absolute).
-        """
-        if self.__extracted_links_on_page is None:
-            self.__extracted_links_on_page = [str(a.get("href")) for a in self._soup.find_all('a', href=True) if isinstance(a, Tag)]
-        return self.__extracted_links_on_page
+            - Relative values are resolved against the document's <base href>, if any,
+              otherwise against the base URL, and fragments are dropped.
+            - javascript:, mailto:, tel:, fragment-only and malformed links are skipped.
+            - The order of first appearance on the page is kept.
+        """
+        extracted_links_on_page: list[str] | None = self.__extracted_links_on_page
+        if extracted_links_on_page is None:
+            base_url: str = self.__link_base_url()
+            # A dict removes duplicates while keeping the page order.
+            links: dict[str, None] = {}
+            for href in self.__LINK_HREFS(self._tree):
+                href = href.strip()
+                if not href or href.lower().startswith(self.__SKIPPED_LINK_PREFIXES):
+                    continue
+                try:
+                    links[urldefrag(urljoin(base_url, href)).url] = None
+                except ValueError:
+                    # Malformed href (e.g. "http://[broken"); skip the link rather than fail the page.
+                    continue
+            extracted_links_on_page = self.__extracted_links_on_page = list(links)
+        return extracted_links_on_page
 
     @property
-    def _soup(self) -> BeautifulSoup:
+    def _tree(self) -> HtmlElement:
         """
-        Returns the BeautifulSoup object for the HTML content.
+        Returns the parsed lxml document tree for the HTML content, parsing it on first access.
         """
-        return self.__soup
-    
-    def __init__(self, response_text_content: str) -> None:
+        tree: HtmlElement | None = self.__tree
+        if tree is None:
+            tree = self.__tree = self.__parse()
+            # The raw document is not needed once the tree exists.
+            self.__raw = b""
+        return tree
+
+    def __init__(self, response_text_content: bytes | str, base_url: str = "", encoding: str | None = None) -> None:
         """
         Initializes the Extractor with HTML response text.
 
         Parameters:
-            response_text_content (str): The HTML response text to be processed.
+            response_text_content (bytes | str): The HTML response to be processed. Raw bytes are
+                preferred, so the parser can detect the document encoding itself; str content is
+                parsed as UTF-8 and the encoding argument is then ignored.
+            base_url (str, optional): The URL of the page, used to resolve relative links.
+            encoding (str | None, optional): The encoding declared by the server for raw bytes, if any.
+                ASCII and Latin-1 labels are read as windows-1252, as browsers do, and unknown
+                encodings are ignored in favour of detection by the parser.
+        """
+        if isinstance(response_text_content, str):
+            # lxml rejects str documents with an XML encoding declaration; their UTF-8 bytes parse fine.
+            response_text_content, encoding = response_text_content.encode("utf-8"), "utf-8"
+        self.__raw: bytes = response_text_content
+        self.__encoding: str | None = encoding
+        self.__base_url: str = base_url
+        # Parsing is deferred until the tree is first needed; see _tree.
+        self.__tree: HtmlElement | None = None
+        self.__extracted_title: str | None = None
+        self.__extracted_text: str | None = None
+        self.__extracted_links_on_page: list[str] | None = None
+
+    def __link_base_url(self) -> str:
+        """
+        Return the URL that relative links on the page are resolved against.
+
+        The first <base href> of the document wins, itself resolved against the page URL;
+        a missing or malformed one falls back to the page URL.
+        """
+        base_hrefs: list[str] = self.__BASE_HREF(self._tree)
+        if not base_hrefs:
+            return self.__base_url
+        try:
+            return urljoin(self.__base_url, base_hrefs[0].strip())
+        except ValueError:
+            return self.__base_url
+
+    def __parse(self) -> HtmlElement:
+        """
+        Parse the raw HTML content into an lxml document tree.
+        """
+        encoding: str | None = _web_encoding(self.__encoding)
+        try:
+            parser: lxml.html.HTMLParser = _html_parser(encoding)
+        except LookupError:
+            encoding = None
+            parser = _html_parser()
+        try:
+            tree: HtmlElement = lxml.html.document_fromstring(self.__raw, parser=parser)
+            if _stopped_at_invalid_bytes(parser):
+                # Without a declared encoding, the one libxml2 detected (e.g. from <meta charset>) is used.
+                detected: str | None = _web_encoding(tree.getroottree().docinfo.encoding)
+                tree = self.__parse_decoded(self.__raw, encoding or detected or "windows-1252")
+            return tree
+        except etree.ParserError:
+            # Empty documents are treated as pages without title and content.
+            return lxml.html.document_fromstring("<html></html>", parser=_html_parser())
+
+    def __parse_decoded(self, raw: bytes, encoding: str) -> HtmlElement:
         """
-        self.__soup = BeautifulSoup(response_text_content, "html.parser")
-        self.__extracted_links_on_page = None
+        Parse a document that libxml2 could not read to the end in its encoding.
+
+        The bytes are decoded by Python instead, replacing the invalid ones, and the
+        result is parsed as UTF-8 so the rest of the page is kept.
+
+        Parameters:
+            raw (bytes): The raw document.
+            encoding (str): The encoding the document was parsed with, declared or detected.
+        """
+        try:
+            text: str = raw.decode(encoding, errors="replace")
+        except LookupError:
+            text = raw.decode("windows-1252", errors="replace")
+        return lxml.html.document_fromstring(text.encode("utf-8"), parser=_html_parser("utf-8"))
 
     def get_title(self) -> str:
         """
         Extracts the title from the HTML content.
         """
-        return self._soup.title.get_text() if self._soup.title is not None else "No title"
+        # Only the document title in <head>: a direct path avoids scanning the whole tree when there is
+        # no title, and never picks up the <title> of an inline SVG.
+        title: str | None = self._tree.findtext("head/title")
+        if title is None:
+            title_text: list[str] = self.__ANY_TITLE_TEXT(self._tree)
+            title = "".join(title_text) if title_text else None
+        return title if title is not None else "No title"
 
     def get_text(self) -> str:
         """
         Extracts and cleans the main text content from the HTML, removing irrelevant tags.
         """
-        for irrelevant in self._soup.find_all(["script", "style", "img", "figure", "video", "audio", "button", "svg", "canvas", "input", "form", "meta"]):
-            irrelevant.decompose()
-        raw_text: str = self._soup.get_text(separator="\n")
-        cleaned_text: str = " ".join(raw_text.split())
+        # with_tail=False keeps the text that follows a removed element.
+        etree.strip_elements(self._tree, *self.__IRRELEVANT_TAGS, with_tail=False)
+        raw_text: str = "\n".join(self.__TEXT_NODES(self._tree))
+        # A single C-level substitution instead of splitting the page into a list of words.
+        cleaned_text: str = self.__WHITESPACE.sub(" ", raw_text).strip()
         return cleaned_text if cleaned_text else "No content"
 
 class Website:
@@ -81,13 +355,19 @@ class Website:
     A class to represent a website.
     """
 
-    __DEFAULT_ALLOWED_DOMAINS: list[str] = [".com", ".org", ".net"]
+    __DEFAULT_ALLOWED_DOMAINS: tuple[str, ...] = (".com", ".org", ".net", ".io")
+    # Upper bound for a downloaded page body; anything larger is cut off or rejected.
+    __MAX_CONTENT_BYTES: int = 5 * 1024 * 1024
+    __CHARSET: re.Pattern[str] = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+    __CACHE_SIZE: int = 256
+    # Seconds after which a cached page is considered stale and fetched again.
+    __CACHE_TTL: float = 900.0
+    __cache: OrderedDict[str, tuple[float, "Website"]] = OrderedDict()
+    __cache_lock: Lock = Lock()
 
-    __title: str = ""
-    __website_url: str = ""
-    __text: str = ""
-    __allowed_domains: list[str] = []
-    __links_on_page: list[str] | None = None
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access.
+    __slots__ = ("__title", "__website_url", "__text", "__allowed_domains", "__links_on_page", "__fetch_failed", "__session")
 
     @property
     def title(self) -> str:
@@ -118,17 +398,18 @@ class Website:
         return self.__links_on_page
 
     @property
-    def _allowed_domains(self) -> list[str]:
+    def _allowed_domains(self) -> tuple[str, ...]:
         """
-        Returns the list of allowed domain suffixes.
+        Returns the allowed domain suffixes.
         """
         return self.__allowed_domains
 
     @_allowed_domains.setter
-    def _allowed_domains(self, value: list[str] | str) -> None:
+    def _allowed_domains(self, value: list[str] | tuple[str, ...] | str) -> None:
         """
-        Sets the list of allowed domain suffixes.
+        Sets the allowed domain suffixes.
         Filters out empty strings and ensures each suffix starts with a dot.
+        The suffixes are stored as a tuple so they can be passed to str.endswith directly.
         """
         if isinstance(value, str):
             value = [
@@ -142,19 +423,14 @@ class Website:
                 for item in value
                 if item
             ]
-        self.__allowed_domains = value
+        self.__allowed_domains = tuple(value)
 
     def _set_website_url(self, value: str) -> None:
         """
         Protected: set the website URL after validating and fetch website data.
         Use this from inside the class to initialize or change the URL.
         """
-        if not value:
-            raise ValueError("Website URL must be provided")
-
-        parsed_url: ParseResult = urlparse(value)
-
-        self._validate(parsed_url)
+        _validate_url(value, self._allowed_domains)
 
         self.__website_url = value
         self.__fetch_website_data()
@@ -166,64 +442,6 @@ class Website:
         """
         return self.__fetch_failed
 
-    def _validate(self, parsed_url: ParseResult) -> None:
-        """
-        Validate the parsed URL.
-
-        Parameters:
-            parsed_url: The parsed URL to validate.
-
-        Raises:
-            ValueError: If the URL is missing parts, uses an invalid scheme,
-                        points to a local/private address, or is not in allowed domains.
-        """
-        if not parsed_url.netloc or parsed_url.scheme not in ("http", "https"):
-            raise ValueError("Website URL must be a valid URL")
-
-        if not parsed_url.hostname:
-            raise ValueError("Website URL must contain a valid hostname")
-
-        if self.__is_local_address(parsed_url.hostname):
-            raise ValueError("Website URL must not be a local address")
-
-        if not self.__is_allowed_domain(parsed_url.hostname):
-            raise ValueError("Website URL must be an allowed domain")
-
-    def __is_local_address(self, hostname: str) -> bool:
-        """
-        Check if the given hostname is a local address.
-
-        Parameters:
-            hostname (str): The hostname to check.
-
-        Returns:
-            bool: True if the hostname is a local address, False otherwise.
-        """
-        if hostname in ("localhost", "127.0.0.1", "::1"):
-            return True
-
-        try:
-            ip: IPv4Address | IPv6Address = ip_address(hostname)
-            if ip.is_loopback or ip.is_private or ip.is_link_local or ip.is_reserved:
-                return True
-        except ValueError:
-            return False
-
-        return False
-
-    def __is_allowed_domain(self, hostname: str) -> bool:
-        """
-        Check if the given hostname is an allowed domain.
-
-        Parameters:
-            hostname (str): The hostname to check.
-
-        Returns:
-            bool: True if the hostname is an allowed domain, False otherwise.
-        """
-        allowed_domains = [".com", ".org", ".net", ".io"]
-        return any(hostname.endswith(domain) for domain in allowed_domains)
-
     def __fetch_website_data(self) -> None:
         """
         Fetch website content and populate title, text, and links.
@@ -233,33 +451,84 @@ class Website:
             - Performs an HTTP GET with a browser-like User-Agent.
         """
         try:
-            get_fn = self.__session.get if self.__session else get
-            response = get_fn(
+            get_fn = (self.__session or _SESSION).get
+            with get_fn(
                 self.website_url,
-                timeout=10,
+                timeout=(5, 15),
                 verify=True,
-                headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36"}
-            )
+                stream=True
+            ) as response:
+                # Decide from the status and headers alone whether the body is worth downloading.
+                rejection: tuple[str, str] | None = self.__reject_response(response)
+                # The final URL after redirects is the base for the page's relative links.
+                final_url: str = response.url
+                # Only an explicit charset is passed on; requests would otherwise assume ISO-8859-1 for text/html.
+                charset: re.Match[str] | None = self.__CHARSET.search(response.headers.get("Content-Type", ""))
+                content: bytes = b"" if rejection else self.__read_body(response)
         except RequestException as e:
             self.__title = "Error"
             self.__text = str(e)
             self.__fetch_failed = True
             return
-        
-        if response.ok:
-            extractor: Extractor = Extractor(response.text)
+
+        if rejection is None:
+            extractor: Extractor = Extractor(content, final_url, charset.group(1) if charset else None)
+            # Links are read before the text, since text extraction strips elements (e.g. forms) from the tree.
+            self.__links_on_page = extractor.extracted_links_on_page
             self.__title = extractor.extracted_title
             self.__text = extractor.extracted_text
-            self.__links_on_page = extractor.extracted_links_on_page
         else:
-            if response.status_code == 404:
-                self.__title = "Not Found"
-                self.__text = "The requested page was not found (404)."
-            else:
-                self.__title = "Error"
-                self.__text = f"Error: {response.status_code} - {response.reason}"
+            self.__title, self.__text = rejection
             self.__fetch_failed = True
 
+    def __read_body(self, response: Response) -> bytes:
+        """
+        Read the body of a streamed response, stopping once the size limit is reached.
+
+        The limit applies to the decoded (decompressed) content, so a small compressed
+        response cannot expand into an arbitrarily large page.
+
+        Parameters:
+            response (requests.Response): A streamed response whose body has not been read yet.
+
+        Returns:
+            bytes: At most __MAX_CONTENT_BYTES of the body.
+        """
+        chunks: list[bytes] = []
+        remaining: int = self.__MAX_CONTENT_BYTES
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk[:remaining])
+            remaining -= len(chunk)
+            if remaining <= 0:
+                break
+        return b"".join(chunks)
+
+    def __reject_response(self, response: Response) -> tuple[str, str] | None:
+        """
+        Check the response status and headers before its body is downloaded.
+
+        Parameters:
+            response (requests.Response): A streamed response whose body has not been read yet.
+
+        Returns:
+            tuple[str, str] | None: A (title, text) pair describing why the page is skipped,
+                or None if the body should be downloaded.
+        """
+        if response.status_code == 404:
+            return "Not Found", "The requested page was not found (404)."
+        if not response.ok:
+            return "Error", f"Error: {response.status_code} - {response.reason}"
+
+        content_type: str = response.headers.get("Content-Type", "")
+        if content_type and "html" not in content_type.lower():
+            return "Error", f"Unsupported content type: {content_type}"
+
+        content_length: str = response.headers.get("Content-Length", "")
+        if content_length.isdigit() and int(content_length) > self.__MAX_CONTENT_BYTES:
+            return "Error", f"Page is too large: {content_length} bytes"
+
+        return None
+
     def __init__(self, website_url: str, allowed_domains: list[str] | str | None = None, session: Session | None = None) -> None:
         """
         Initializes the Website object and fetches its data.
@@ -268,17 +537,112 @@ class Website:
             website_url (str): The URL of the website to fetch.
             allowed_domains (list[str] | str, optional): A list of allowed domain suffixes.
                 If a string is provided, it should be a comma-separated list of domain suffixes (e.g., ".com,.org,.net").
-            session (requests.Session | None, optional): Reused HTTP session for connection pooling.
-        """
+            session (requests.Session | None, optional): HTTP session to use instead of the shared module-level one;
+                its own default headers are sent.
+        """
+        self.__title: str = ""
+        self.__website_url: str = ""
+        self.__text: str = ""
+        self.__allowed_domains: tuple[str, ...] = ()
+        self.__links_on_page: list[str] | None = None
         self.__fetch_failed: bool = False
         self.__session: Session | None = session
         if allowed_domains is None:
-            self._allowed_domains = self.__DEFAULT_ALLOWED_DOMAINS.copy()
+            self._allowed_domains = self.__DEFAULT_ALLOWED_DOMAINS
         else:
             self._allowed_domains = allowed_domains
         # Use protected setter internally so the public API exposes only the getter.
         self._set_website_url(website_url)
 
+    @staticmethod
+    def normalize_url(website_url: str) -> str:
+        """
+        Normalize a URL so that equivalent addresses map to the same key.
+        Lowercases the scheme and host, strips the fragment and any trailing slash.
+        URLs that cannot be parsed are returned unchanged; fetching them fails validation.
+        """
+        try:
+            parsed_url: ParseResult = urlparse(website_url)
+        except ValueError:
+            return website_url
+        return urlunparse((
+            parsed_url.scheme.lower(),
+            parsed_url.netloc.lower(),
+            parsed_url.path.rstrip("/"),
+            parsed_url.params,
+            parsed_url.query,
+            ""
+        ))
+
+    @classmethod
+    def get(cls, website_url: str, session: Session | None = None) -> "Website":
+        """
+        Return a Website for the URL, reusing a previously fetched instance when available.
+
+        Successfully fetched websites are kept in a process-wide LRU cache keyed by the
+        normalized URL, so repeated links cost neither an HTTP round-trip nor a reparse.
+        Entries expire after 15 minutes, so long-running processes do not serve stale pages.
+        Failed fetches are not cached, so they are retried on the next call.
+
+        Parameters:
+            website_url (str): The URL of the website to fetch.
+            session (requests.Session | None, optional): HTTP session to use instead of the shared module-level one;
+                its own default headers are sent.
+        """
+        key: str = cls.normalize_url(website_url)
+        with cls.__cache_lock:
+            cached: tuple[float, Website] | None = cls.__cache.get(key)
+            if cached is not None:
+                fetched_at, cached_website = cached
+                if monotonic() - fetched_at < cls.__CACHE_TTL:
+                    cls.__cache.move_to_end(key)
+                    return cached_website
+                del cls.__cache[key]
+
+        website: Website = cls(website_url, session=session)
+        if not website.fetch_failed:
+            with cls.__cache_lock:
+                cls.__cache[key] = (monotonic(), website)
+                cls.__cache.move_to_end(key)
+                if len(cls.__cache) > cls.__CACHE_SIZE:
+                    cls.__cache.popitem(last=False)
+        return website
+
+    @classmethod
+    def fetch_many(cls, website_urls: list[str], max_workers: int = 5) -> list["Website | None"]:
+        """
+        Fetch several websites concurrently through Website.get.
+
+        URLs that normalize to the same address are fetched only once, even when they
+        are not cached yet, and share the resulting instance.
+
+        Parameters:
+            website_urls (list[str]): The URLs to fetch.
+            max_workers (int, optional): Upper bound on simultaneous requests.
+
+        Returns:
+            list[Website | None]: Websites in the same order as the URLs;
+                None where the page could not be fetched (invalid URL or any other error),
+                so a single bad page does not abort the others.
+        """
+        if not website_urls:
+            return []
+
+        # One representative URL per normalized address, in order of first appearance.
+        unique_urls: dict[str, str] = {}
+        for website_url in website_urls:
+            unique_urls.setdefault(cls.normalize_url(website_url), website_url)
+
+        def fetch(website_url: str) -> "Website | None":
+            try:
+                return cls.get(website_url)
+            except Exception:
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_urls))) as executor:
+            fetched: dict[str, Website | None] = dict(zip(unique_urls, executor.map(fetch, unique_urls.values())))
+        return [fetched[cls.normalize_url(website_url)] for website_url in website_urls]
+
     def __str__(self) -> str:
         """
         Returns a string representation of the Website object.